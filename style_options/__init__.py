@@ -0,0 +1,11 @@
+from .preprocess import enhance_image, change_resolution, PreprocessBuffers, preprocess_image
+from .segmentation import SEGMENTATION_METHODS, get_garment_mask, segment_garment, compare_segmentation_methods
+from .dominant_color import (DOMINANT_COLOR_METHODS, DEFAULT_DOMINANT_COLOR_METHOD, get_dominant_bgr,
+                             get_dominant_bgr_using_meanshift_brightness, compare_dominant_color_methods)
+from .palette import (custom_colors, custom_color_family, PaletteIndex, ColorNameCache, palette_index,
+                      color_name_cache, get_closest_color_name_using_ciede2000_distance,
+                      get_color_family_from_color_name, convert_bgr_to_rgb)
+from .loader import iter_image_paths, read_image, prefetch_images
+from .pipeline import analyze_image, analyze_images, process_image, run_batch, RunProfile
+from .results import open_results_writer, read_results, export_results_to_excel
+from .benchmark import make_synthetic_garment, run_benchmark
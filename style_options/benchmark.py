@@ -0,0 +1,71 @@
+import os
+import json
+import tempfile
+
+import cv2
+import numpy as np
+import pandas as pd
+
+from .palette import palette_index
+from .pipeline import RunProfile, run_batch
+
+
+def make_synthetic_garment(rng, width=700, height=800):
+  # t-shirt shaped garment in a random color on a plain light background, with a small print,
+  # vertical shading and sensor noise; returns the BGR image and the garment's true BGR color
+  background = int(rng.integers(200, 256))
+  image = np.full((height, width, 3), background, dtype=np.uint8)
+  garment_bgr = tuple(int(c) for c in rng.integers(0, 256, 3))
+  outline = np.array([[0.30, 0.15], [0.70, 0.15], [0.85, 0.35], [0.75, 0.40], [0.72, 0.90],
+                      [0.28, 0.90], [0.25, 0.40], [0.15, 0.35]]) * [width, height]
+  cv2.fillPoly(image, [outline.astype(np.int32)], garment_bgr)
+  print_bgr = tuple(int(c) for c in rng.integers(0, 256, 3))
+  cv2.circle(image, (width // 2, height // 2), int(width * 0.08), print_bgr, -1)
+
+  shading = np.linspace(0.9, 1.05, height)[:, None, None]
+  noise = rng.normal(0, 4, image.shape)
+  image = np.clip(image * shading + noise, 0, 255).astype(np.uint8)
+  return image, garment_bgr
+
+
+def run_benchmark(n_images=20, seed=0, segmentation_methods=('grabcut',),
+                  dominant_color_methods=('meanshift', 'histogram'), workers=1, report_path=None):
+  # reproducible benchmark on generated garments (no network, no catalog needed)
+  # every segmentation x dominant color combination runs over the same images; each row has the
+  # throughput, per-stage percentiles and how often the color family matches the garment's true color
+  rng = np.random.default_rng(seed)
+  rows = []
+  with tempfile.TemporaryDirectory() as image_directory:
+    true_families = {}
+    filepaths = []
+    for n in range(n_images):
+      image, garment_bgr = make_synthetic_garment(rng)
+      image_name = 'synthetic_%04d.png' % n
+      filepath = os.path.join(image_directory, image_name)
+      cv2.imwrite(filepath, image)
+      filepaths.append(filepath)
+      true_families[image_name] = palette_index.closest_color_family(garment_bgr)
+
+    for segmentation_method in segmentation_methods:
+      for dominant_color_method in dominant_color_methods:
+        run_profile = RunProfile()
+        family_matches = []
+        for record in run_batch(filepaths, workers=workers, segmentation_method=segmentation_method,
+                                dominant_color_method=dominant_color_method, profile=True):
+          run_profile.add(record)
+          if record['error'] is None:
+            family_matches.append(record['color_family_name'] == true_families[record['image_name']])
+        summary = run_profile.summary()
+        rows.append({
+            'segmentation_method': segmentation_method,
+            'dominant_color_method': dominant_color_method,
+            'images_per_second': summary['images_per_second'],
+            'family_accuracy': float(np.mean(family_matches)) if family_matches else 0.0,
+            'errors': summary['errors'],
+            'stages': summary['stages'],
+        })
+
+  if report_path is not None:
+    with open(report_path, 'w', encoding='utf-8') as f:
+      json.dump({'n_images': n_images, 'seed': seed, 'workers': workers, 'results': rows}, f, indent=2)
+  return pd.DataFrame([{key: value for key, value in row.items() if key != 'stages'} for row in rows])
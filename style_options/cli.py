@@ -0,0 +1,151 @@
+import os
+import sys
+import json
+import logging
+import argparse
+
+from .palette import color_name_cache
+from .segmentation import SEGMENTATION_METHODS
+from .dominant_color import DEFAULT_DOMINANT_COLOR_METHOD, DOMINANT_COLOR_METHODS
+from .loader import iter_image_paths
+from .pipeline import RunProfile, analyze_image, run_batch
+from .results import export_results_to_excel, open_results_writer
+from .benchmark import run_benchmark
+
+logger = logging.getLogger(__name__)
+
+
+def run_directory(directory, results_path, excel_path=None, profile_report_path=None, workers=None,
+                  marked_directory=None, track_memory=False, **process_options):
+  # batch run over every image in directory (not its subdirectories), what the notebook script used to do
+  # records are appended to results_path as they come in; rerunning skips images already in it
+  run_profile = RunProfile()
+  os.makedirs(os.path.dirname(os.path.abspath(results_path)), exist_ok=True)
+  if marked_directory is not None:
+    os.makedirs(marked_directory, exist_ok=True)
+
+  with open_results_writer(results_path) as results_writer:
+    done_image_names = results_writer.completed_image_names()
+    filepaths = (filepath for filepath in iter_image_paths(directory)
+                 if os.path.basename(filepath) not in done_image_names)
+
+    for record in run_batch(filepaths, workers=workers, marked_directory=marked_directory,
+                            profile=True, track_memory=track_memory, **process_options):
+      image_name = record['image_name']
+      run_profile.add(record)
+      if record['error'] is not None:
+        logger.warning('skipping image: %s %s', image_name, record['error'])
+        continue
+
+      print("rgb code and color_name and color_family: ", image_name, record['rgb_code_tuple'],
+            record['color_name'], record['color_family_name'])
+      results_writer.write(record)
+
+  if profile_report_path is not None:
+    run_profile.write_json(profile_report_path)
+  if excel_path is not None:
+    export_results_to_excel(results_path, excel_path)
+  return run_profile.summary()
+
+
+def add_method_arguments(parser):
+  parser.add_argument('--segmentation', default='grabcut', choices=sorted(SEGMENTATION_METHODS))
+  parser.add_argument('--dominant-color', default=DEFAULT_DOMINANT_COLOR_METHOD, choices=sorted(DOMINANT_COLOR_METHODS))
+  parser.add_argument('--lut-dir', help='name colors from a quantized lookup table cached in this directory; '
+                      'lossy, with 5 bits about 81%% of colors get the exact name and 92%% the same family')
+  parser.add_argument('--lut-bits', type=int, default=5, choices=[5, 6, 7, 8],
+                      help='bits per channel of the lookup table: more bits are more exact, but the table is '
+                      'larger and slower to build the first time (8 = full 256^3 cube, 32 MB)')
+
+
+def build_parser():
+  parser = argparse.ArgumentParser(prog='style_options', description='dominant garment color names for product images')
+  subparsers = parser.add_subparsers(dest='command', required=True)
+
+  batch = subparsers.add_parser('batch', help='analyze every image in a directory')
+  batch.add_argument('directory')
+  batch.add_argument('--output', required=True, help='results file: .csv, .jsonl or .parquet')
+  batch.add_argument('--excel', help='also export the results to this .xlsx file at the end')
+  batch.add_argument('--profile-report', help='write per-stage timing percentiles to this json file')
+  batch.add_argument('--track-memory', action='store_true',
+                     help='also record per-stage memory (tracemalloc and process RSS) in the profile report')
+  batch.add_argument('--marked-dir', help='save images marked with their dominant color here')
+  batch.add_argument('--workers', type=int, default=None, help='processes, default one per core')
+  batch.add_argument('--reduced-decode', type=int, default=1, choices=[1, 2, 4, 8])
+  add_method_arguments(batch)
+
+  analyze = subparsers.add_parser('analyze', help='analyze single image files, prints one json line each')
+  analyze.add_argument('files', nargs='+')
+  add_method_arguments(analyze)
+
+  benchmark = subparsers.add_parser('benchmark', help='compare methods on synthetic garments')
+  benchmark.add_argument('--images', type=int, default=20)
+  benchmark.add_argument('--seed', type=int, default=0)
+  benchmark.add_argument('--workers', type=int, default=1)
+  benchmark.add_argument('--segmentation', nargs='+', default=['grabcut'], choices=sorted(SEGMENTATION_METHODS))
+  benchmark.add_argument('--dominant-color', nargs='+', default=['meanshift', 'histogram'],
+                         choices=sorted(DOMINANT_COLOR_METHODS))
+  benchmark.add_argument('--report', help='write the full report to this json file')
+
+  serve = subparsers.add_parser('serve', help='run the http service')
+  serve.add_argument('--host', default='127.0.0.1')
+  serve.add_argument('--port', type=int, default=8000)
+  serve.add_argument('--workers', type=int, default=2, help='threads running the per-image stages')
+  serve.add_argument('--max-batch-size', type=int, default=8)
+  serve.add_argument('--max-wait-ms', type=float, default=5.0)
+  add_method_arguments(serve)
+
+  loadtest = subparsers.add_parser('loadtest', help='load test a running service')
+  loadtest.add_argument('files', nargs='*', help='images to send, default synthetic garments')
+  loadtest.add_argument('--url', default='http://127.0.0.1:8000')
+  loadtest.add_argument('--requests', type=int, default=200)
+  loadtest.add_argument('--concurrency', type=int, default=8)
+  return parser
+
+
+def main(argv=None):
+  args = build_parser().parse_args(argv)
+  logging.basicConfig(level=logging.INFO, format='%(levelname)s %(name)s: %(message)s')
+
+  if args.command == 'analyze' and args.lut_dir:
+    color_name_cache.use_lut(args.lut_dir, args.lut_bits)
+
+  if args.command == 'batch':
+    run_directory(args.directory, args.output, excel_path=args.excel, profile_report_path=args.profile_report,
+                  workers=args.workers, marked_directory=args.marked_dir, track_memory=args.track_memory,
+                  reduced_decode=args.reduced_decode, lut_dir=args.lut_dir, lut_bits=args.lut_bits,
+                  segmentation_method=args.segmentation, dominant_color_method=args.dominant_color)
+
+  elif args.command == 'analyze':
+    for filepath in args.files:
+      with open(filepath, 'rb') as f:
+        record = analyze_image(f.read(), dominant_color_method=args.dominant_color,
+                               segmentation_method=args.segmentation)
+      record['image_name'] = os.path.basename(filepath)
+      print(json.dumps(record))
+
+  elif args.command == 'benchmark':
+    df = run_benchmark(n_images=args.images, seed=args.seed, segmentation_methods=args.segmentation,
+                       dominant_color_methods=args.dominant_color, workers=args.workers, report_path=args.report)
+    print(df.to_string(index=False))
+
+  elif args.command == 'serve':
+    from .service import serve
+    serve(args.host, args.port, workers=args.workers, max_batch_size=args.max_batch_size,
+          max_wait_ms=args.max_wait_ms, lut_dir=args.lut_dir, lut_bits=args.lut_bits,
+          segmentation_method=args.segmentation, dominant_color_method=args.dominant_color)
+
+  elif args.command == 'loadtest':
+    from .service import run_load_test, synthetic_payloads
+    if args.files:
+      payloads = []
+      for filepath in args.files:
+        with open(filepath, 'rb') as f:
+          payloads.append(f.read())
+    else:
+      payloads = synthetic_payloads()
+    print(json.dumps(run_load_test(args.url, payloads, requests=args.requests, concurrency=args.concurrency), indent=2))
+
+
+if __name__ == '__main__':
+  sys.exit(main())
@@ -0,0 +1,169 @@
+import time
+
+import cv2
+import numpy as np
+import pandas as pd
+from sklearn.cluster import MeanShift
+from sklearn.cluster import MiniBatchKMeans
+from sklearn.cluster import estimate_bandwidth
+
+from .palette import palette_index
+
+
+def get_non_background_hsv_pixels(image, mask=None, hsv_buffer=None):
+    # with mask, only the garment pixels are taken straight from the unmasked image,
+    # instead of building a segmented copy first
+    # Convert image to HSV color space
+    hsv_image = cv2.cvtColor(image, cv2.COLOR_BGR2HSV, dst=hsv_buffer)
+
+    # Flatten the image into a 1D array of pixels
+    pixels = hsv_image.reshape(-1, 3)
+    if mask is not None:
+        pixels = pixels[mask.reshape(-1) > 0]
+
+    # Extract the brightness values (V channel)
+    brightness_values = pixels[:, 2]
+    # Define the threshold for background-like brightness values (adjust as needed)
+    background_threshold = 1
+    # Create a mask to exclude background pixels based on brightness
+    mask = brightness_values > background_threshold
+    # Apply the mask to filter out background pixels
+    return pixels[mask]
+
+
+def subsample_pixels(pixels, max_pixels, seed=0):
+    # fixed seed so the same image always gives the same dominant color
+    if max_pixels is None or len(pixels) <= max_pixels:
+        return pixels
+    rng = np.random.default_rng(seed)
+    return pixels[rng.choice(len(pixels), max_pixels, replace=False)]
+
+
+def dominant_hsv_using_meanshift(pixels, max_pixels=None, seed=0):
+    # Use MeanShift clustering to find the dominant color
+    pixels = subsample_pixels(pixels, max_pixels, seed)
+    bandwidth = estimate_bandwidth(pixels, quantile=0.2, n_samples=500, random_state=seed)
+    meanshift = MeanShift(bandwidth=bandwidth, bin_seeding=True)
+    meanshift.fit(pixels)
+
+    # cluster_centers_ is sorted by how many points fall inside each window, not by how many
+    # pixels end up in the cluster, so pick the most populated cluster explicitly
+    populations = np.bincount(meanshift.labels_, minlength=len(meanshift.cluster_centers_))
+    return meanshift.cluster_centers_[np.argmax(populations)]
+
+
+def dominant_hsv_using_meanshift_subsample(pixels, max_pixels=20000, seed=0):
+    return dominant_hsv_using_meanshift(pixels, max_pixels=max_pixels, seed=seed)
+
+
+def dominant_hsv_using_histogram(pixels, hue_bins=18, saturation_bins=8, value_bins=8,
+                                 max_pixels=20000, shift_iterations=5, seed=0):
+    # mode of a quantized HSV cube, then a few mean shift steps from that mode with the
+    # bandwidth MeanShift would use, so the result lands on the same peak as full MeanShift
+    # opencv hue is 0-179, saturation and value are 0-255
+    pixels = subsample_pixels(pixels, max_pixels, seed)
+    h = pixels[:, 0].astype(np.intp) * hue_bins // 180
+    s = pixels[:, 1].astype(np.intp) * saturation_bins // 256
+    v = pixels[:, 2].astype(np.intp) * value_bins // 256
+    cells = (h * saturation_bins + s) * value_bins + v
+    counts = np.bincount(cells, minlength=hue_bins * saturation_bins * value_bins)
+
+    pixels = pixels.astype(np.float64)
+    center = pixels[cells == np.argmax(counts)].mean(axis=0)
+    bandwidth = estimate_bandwidth(pixels, quantile=0.2, n_samples=500, random_state=seed)
+    for _ in range(shift_iterations):
+        in_window = np.sum((pixels - center) ** 2, axis=1) <= bandwidth ** 2
+        if not in_window.any():
+            break
+        new_center = pixels[in_window].mean(axis=0)
+        if np.allclose(new_center, center, atol=0.5):
+            center = new_center
+            break
+        center = new_center
+    return center
+
+
+def dominant_hsv_using_kmeans(pixels, n_clusters=5, max_pixels=20000, seed=0):
+    # MiniBatch k-means on a subsample, the dominant color is the center of the largest cluster
+    pixels = subsample_pixels(pixels, max_pixels, seed).astype(np.float64)
+    n_clusters = min(n_clusters, len(np.unique(pixels, axis=0)))
+    kmeans = MiniBatchKMeans(n_clusters=n_clusters, random_state=seed, n_init=3, batch_size=2048)
+    labels = kmeans.fit_predict(pixels)
+    populations = np.bincount(labels, minlength=n_clusters)
+    return kmeans.cluster_centers_[np.argmax(populations)]
+
+
+# name -> function taking the (N, 3) non-background HSV pixels and returning the dominant HSV color
+DOMINANT_COLOR_METHODS = {
+    'meanshift': dominant_hsv_using_meanshift,
+    'meanshift_subsample': dominant_hsv_using_meanshift_subsample,
+    'histogram': dominant_hsv_using_histogram,
+    'kmeans': dominant_hsv_using_kmeans,
+}
+
+# used wherever a dominant color method is not given (library, CLI, service); meanshift stays available as
+# the slow reference the others are checked against (see compare_dominant_color_methods)
+DEFAULT_DOMINANT_COLOR_METHOD = 'histogram'
+
+
+def get_dominant_bgr(image, method=DEFAULT_DOMINANT_COLOR_METHOD, mask=None, marked=True, hsv_buffer=None):
+    # marked=False skips the marked image copy (returned as None) when nothing will be saved
+    non_background_pixels = get_non_background_hsv_pixels(image, mask=mask, hsv_buffer=hsv_buffer)
+    if len(non_background_pixels) == 0:
+        raise ValueError('no garment pixels found')
+
+    # Get the HSV values of the dominant color
+    dominant_color_hsv = DOMINANT_COLOR_METHODS[method](non_background_pixels)
+    dominant_color_hsv = np.clip(np.round(dominant_color_hsv), 0, 255)
+
+    # Convert dominant color back to BGR color space for visualization
+    dominant_color_bgr = cv2.cvtColor(np.uint8([[dominant_color_hsv]]), cv2.COLOR_HSV2BGR)[0][0]
+
+    if not marked:
+        return dominant_color_bgr.astype(int), None
+
+    # Create a copy of the image
+    if mask is None:
+        marked_image = image.copy()
+    else:
+        marked_image = cv2.bitwise_and(image, image, mask=mask)
+
+    # Draw a rectangle with the dominant color on the copied image
+    cv2.rectangle(marked_image, (0, 0), (100, 100), dominant_color_bgr.tolist(), -1)
+
+    return dominant_color_bgr.astype(int), marked_image
+
+
+def get_dominant_bgr_using_meanshift_brightness(image):
+    return get_dominant_bgr(image, method='meanshift')
+
+
+def compare_dominant_color_methods(images, methods=None, reference='meanshift'):
+    # accuracy / latency check of the fast methods against the reference one on already segmented images
+    # returns one row per method: mean latency and how often name and family agree with the reference
+    if methods is None:
+        methods = list(DOMINANT_COLOR_METHODS)
+    colors = {method: [] for method in methods}
+    seconds = {method: [] for method in methods}
+    for image in images:
+        for method in methods:
+            start = time.perf_counter()
+            color_bgr, _ = get_dominant_bgr(image, method=method)
+            seconds[method].append(time.perf_counter() - start)
+            colors[method].append(color_bgr)
+
+    reference_names = palette_index.closest_color_names(colors[reference])
+    reference_families = palette_index.closest_color_families(colors[reference])
+    rows = []
+    for method in methods:
+        names = palette_index.closest_color_names(colors[method])
+        families = palette_index.closest_color_families(colors[method])
+        rows.append({
+            'method': method,
+            'mean_ms': 1000 * float(np.mean(seconds[method])),
+            'max_ms': 1000 * float(np.max(seconds[method])),
+            'name_agreement': float(np.mean([a == b for a, b in zip(names, reference_names)])),
+            'family_agreement': float(np.mean([a == b for a, b in zip(families, reference_families)])),
+            'max_bgr_difference': int(np.max(np.abs(np.array(colors[method]) - np.array(colors[reference])))),
+        })
+    return pd.DataFrame(rows)
@@ -0,0 +1,56 @@
+import os
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+
+import cv2
+
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp', '.webp', '.tif', '.tiff')
+
+# everything is resized to 600x700 anyway, so large originals can be decoded at 1/2, 1/4 or 1/8
+# size straight from the jpeg, which is much cheaper than a full decode
+# only use a factor that keeps the catalog's smallest images above 600x700
+REDUCED_DECODE_FLAGS = {
+    1: cv2.IMREAD_COLOR,
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+}
+
+
+def iter_image_paths(directory, extensions=IMAGE_EXTENSIONS, recursive=False):
+  # lazy walk with os.scandir, yields paths as they are found instead of listing the whole drive first
+  # not recursive by default: results and resume are keyed on the file name, which is only unique in one directory
+  with os.scandir(directory) as entries:
+    for entry in entries:
+      if entry.is_dir(follow_symlinks=False):
+        if recursive:
+          yield from iter_image_paths(entry.path, extensions, recursive)
+      elif entry.name.lower().endswith(extensions):
+        yield entry.path
+
+
+def read_image(filepath, reduced_decode=1):
+  return cv2.imread(filepath, REDUCED_DECODE_FLAGS[reduced_decode])
+
+
+def prefetch_images(filepaths, queue_size=8, threads=2, reduced_decode=1):
+  # yields (filepath, image) in order while background threads decode the next queue_size files,
+  # so disk / network drive latency overlaps with compute (cv2.imread releases the GIL)
+  # at most queue_size decoded images are held in memory; unreadable files come through as
+  # (filepath, None), like cv2.imread, so the caller can report them
+  filepaths = iter(filepaths)
+  executor = ThreadPoolExecutor(max_workers=threads)
+  try:
+    pending = deque((filepath, executor.submit(read_image, filepath, reduced_decode))
+                    for filepath in itertools.islice(filepaths, queue_size))
+    while pending:
+      filepath, future = pending.popleft()
+      next_filepath = next(filepaths, None)
+      if next_filepath is not None:
+        pending.append((next_filepath, executor.submit(read_image, next_filepath, reduced_decode)))
+
+      yield filepath, future.result()
+  finally:
+    executor.shutdown(wait=True, cancel_futures=True)
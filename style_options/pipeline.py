@@ -0,0 +1,377 @@
+import os
+import sys
+import json
+import time
+import threading
+import tracemalloc
+import traceback
+import functools
+import contextlib
+import multiprocessing
+from collections import defaultdict
+
+try:
+  import resource
+except ImportError:
+  # windows
+  resource = None
+
+import cv2
+import numpy as np
+
+from .preprocess import PreprocessBuffers, preprocess_image
+from .segmentation import get_garment_mask
+from .dominant_color import DEFAULT_DOMINANT_COLOR_METHOD, get_dominant_bgr
+from .palette import (color_name_cache, convert_bgr_to_rgb, get_closest_color_name_using_ciede2000_distance,
+                      get_color_family_from_color_name)
+from .loader import read_image, prefetch_images
+
+
+_thread_state = threading.local()
+
+
+def get_preprocess_buffers():
+  # one set per thread (so also per worker process), reused by every image that thread handles
+  buffers = getattr(_thread_state, 'preprocess_buffers', None)
+  if buffers is None:
+    buffers = _thread_state.preprocess_buffers = PreprocessBuffers()
+  return buffers
+
+
+def current_rss_bytes():
+  # resident set size of this process right now, None where /proc is not available
+  try:
+    with open('/proc/self/statm') as f:
+      return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+  except (OSError, ValueError, IndexError):
+    return None
+
+
+def max_rss_bytes():
+  # high-water mark of the process RSS; ru_maxrss is in kilobytes on linux and bytes on macOS
+  if resource is None:
+    return None
+  max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+  return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+
+class StageTimer:
+  # wall time of each stage of one image, and with track_memory:
+  # - traced_peak_bytes: peak of python / numpy allocations (tracemalloc), blind to OpenCV's own buffers
+  # - rss_bytes / rss_growth_bytes: process RSS at the end of the stage and how much it changed
+  # - max_rss_growth_bytes: how far the stage pushed the process RSS high-water mark, which also
+  #   catches short-lived OpenCV allocations once they exceed the earlier peak
+
+  def __init__(self, track_memory=False):
+    self.stages = {}
+    self.track_memory = track_memory
+    if track_memory and not tracemalloc.is_tracing():
+      tracemalloc.start()
+
+  @contextlib.contextmanager
+  def stage(self, name):
+    if self.track_memory:
+      start_memory = tracemalloc.get_traced_memory()[0]
+      tracemalloc.reset_peak()
+      start_rss = current_rss_bytes()
+      start_max_rss = max_rss_bytes()
+    start = time.perf_counter()
+    try:
+      yield
+    finally:
+      stats = {'seconds': time.perf_counter() - start}
+      if self.track_memory:
+        stats['traced_peak_bytes'] = tracemalloc.get_traced_memory()[1] - start_memory
+        end_rss = current_rss_bytes()
+        if end_rss is not None:
+          stats['rss_bytes'] = end_rss
+          stats['rss_growth_bytes'] = end_rss - start_rss
+        if start_max_rss is not None:
+          stats['max_rss_growth_bytes'] = max_rss_bytes() - start_max_rss
+      self.stages[name] = stats
+
+
+def decode_image(data):
+  # encoded image bytes (jpeg, png, ...) -> BGR image
+  image = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR)
+  if image is None:
+    raise ValueError('could not decode image')
+  return image
+
+
+def extract_dominant_color(image, dominant_color_method=DEFAULT_DOMINANT_COLOR_METHOD,
+                           segmentation_method='grabcut', marked=False, timer=None):
+  # resize + enhance -> garment mask -> dominant color of one decoded image
+  # returns the dominant BGR color and the marked image (None unless marked=True)
+  if timer is None:
+    timer = StageTimer()
+  buffers = get_preprocess_buffers()
+
+  # enhance_image and change_resolution are fused in preprocess_image
+  with timer.stage('preprocess'):
+    enhanced_image = preprocess_image(image, buffers)
+  with timer.stage('segment_garment'):
+    foreground_mask = get_garment_mask(enhanced_image, method=segmentation_method)
+  with timer.stage('dominant_color'):
+    return get_dominant_bgr(enhanced_image, method=dominant_color_method, mask=foreground_mask,
+                            marked=marked, hsv_buffer=buffers.hsv)
+
+
+def color_record(color_bgr, color_name):
+  return {
+      'rgb_code_tuple': tuple(int(c) for c in convert_bgr_to_rgb(tuple(color_bgr))),
+      'color_name': color_name,
+      'color_family_name': get_color_family_from_color_name(color_name),
+  }
+
+
+def process_image(filepath, dominant_color_method=DEFAULT_DOMINANT_COLOR_METHOD, segmentation_method='grabcut',
+                  marked_directory=None, profile=False, track_memory=False, image=None, read_seconds=None,
+                  reduced_decode=1):
+  # full per-image chain: read -> resize + enhance -> garment mask -> dominant color -> color name
+  # the marked image (dominant color swatch on the segmented garment) is only built when
+  # marked_directory is given
+  # profile=True adds a 'stages' entry to the record with the timings of each stage (see RunProfile)
+  # image is an already decoded image, filepath then only names it
+  # read_seconds marks an image from prefetch_images: the decode ran in a background thread, so the
+  # 'read' stage is the time the caller waited for it, and a prefetched None is not read again
+  timer = StageTimer(track_memory=profile and track_memory)
+  image_name = os.path.basename(filepath)
+  if read_seconds is not None:
+    timer.stages['read'] = {'seconds': read_seconds}
+  elif image is None:
+    with timer.stage('read'):
+      image = read_image(filepath, reduced_decode)
+  if image is None:
+    raise ValueError('could not read image: ' + filepath)
+
+  get_color_BGR, marked_image = extract_dominant_color(image, dominant_color_method, segmentation_method,
+                                                       marked=marked_directory is not None, timer=timer)
+  if marked_directory is not None:
+    cv2.imwrite(os.path.join(marked_directory, 'marked_' + image_name), marked_image)
+
+  with timer.stage('color_naming'):
+    color_name = get_closest_color_name_using_ciede2000_distance(tuple(get_color_BGR))
+
+  record = {'image_name': image_name}
+  record.update(color_record(get_color_BGR, color_name))
+  if profile:
+    record['stages'] = timer.stages
+  return record
+
+
+def analyze_dominant_color(image, dominant_color_method=DEFAULT_DOMINANT_COLOR_METHOD,
+                           segmentation_method='grabcut', timer=None):
+  # the per-image stages of analyze_image(s): decode (for encoded bytes) -> garment mask -> dominant bgr color
+  timer = timer if timer is not None else StageTimer()
+  if isinstance(image, (bytes, bytearray, memoryview)):
+    with timer.stage('decode'):
+      image = decode_image(image)
+  color_bgr, _ = extract_dominant_color(image, dominant_color_method, segmentation_method, timer=timer)
+  return color_bgr
+
+
+def error_record(error):
+  return {'rgb_code_tuple': None, 'color_name': None, 'color_family_name': None,
+          'error': '%s: %s' % (type(error).__name__, error)}
+
+
+def analyze_image(image, dominant_color_method=DEFAULT_DOMINANT_COLOR_METHOD, segmentation_method='grabcut',
+                  profile=False):
+  # library entry point for a single image, given as the encoded file bytes or a decoded BGR ndarray
+  # returns {'rgb_code_tuple', 'color_name', 'color_family_name'}, plus 'stages' with profile=True
+  timer = StageTimer()
+  color_bgr = analyze_dominant_color(image, dominant_color_method, segmentation_method, timer=timer)
+  with timer.stage('color_naming'):
+    color_name = get_closest_color_name_using_ciede2000_distance(tuple(color_bgr))
+
+  record = color_record(color_bgr, color_name)
+  if profile:
+    record['stages'] = timer.stages
+  return record
+
+
+def name_dominant_colors(colors_bgr, timers=None):
+  # names several dominant colors in a single vectorized palette lookup -> one record per color
+  # with timers, each record's timer gets the shared 'color_naming' time
+  start = time.perf_counter()
+  color_names = color_name_cache.closest_color_names(colors_bgr)
+  naming_seconds = time.perf_counter() - start
+  records = []
+  for n, (color_bgr, color_name) in enumerate(zip(colors_bgr, color_names)):
+    record = color_record(color_bgr, color_name)
+    record['error'] = None
+    if timers is not None:
+      timers[n].stages['color_naming'] = {'seconds': naming_seconds}
+    records.append(record)
+  return records
+
+
+def analyze_images(images, dominant_color_method=DEFAULT_DOMINANT_COLOR_METHOD, segmentation_method='grabcut',
+                   profile=False):
+  # analyze_image for several images at once: the per-image stages run one after another, then all
+  # dominant colors are named in a single vectorized palette lookup
+  # returns one record per image in the same order, with 'error' set instead of raising for bad images
+  timers = [StageTimer() for _ in images]
+  colors = [None] * len(images)
+  records = [None] * len(images)
+  for n, image in enumerate(images):
+    try:
+      colors[n] = analyze_dominant_color(image, dominant_color_method, segmentation_method, timer=timers[n])
+    except Exception as e:
+      records[n] = error_record(e)
+
+  found = [n for n in range(len(images)) if records[n] is None]
+  if found:
+    named = name_dominant_colors([colors[n] for n in found], [timers[n] for n in found])
+    for n, record in zip(found, named):
+      records[n] = record
+
+  if profile:
+    for record, timer in zip(records, timers):
+      record['stages'] = timer.stages
+  return records
+
+
+class RunProfile:
+  # collects the 'stages' of every record of a run and summarizes them as percentiles
+
+  def __init__(self, percentiles=(50, 90, 99)):
+    self.percentiles = percentiles
+    self.stage_seconds = defaultdict(list)
+    # stage -> memory stat name (see StageTimer) -> values
+    self.stage_memory = defaultdict(lambda: defaultdict(list))
+    self.images = 0
+    self.errors = 0
+    self.start = time.perf_counter()
+
+  def add(self, record):
+    if record.get('error') is not None:
+      self.errors += 1
+      return
+    self.images += 1
+    stages = record.get('stages')
+    if not stages:
+      return
+    for stage, stats in stages.items():
+      self.stage_seconds[stage].append(stats['seconds'])
+      for key, value in stats.items():
+        if key != 'seconds':
+          self.stage_memory[stage][key].append(value)
+    self.stage_seconds['total'].append(sum(stats['seconds'] for stats in stages.values()))
+
+  def summary(self):
+    wall_seconds = time.perf_counter() - self.start
+    stages = {}
+    for stage, seconds in self.stage_seconds.items():
+      milliseconds = 1000 * np.array(seconds)
+      stats = {'count': len(seconds), 'mean_ms': float(milliseconds.mean()), 'max_ms': float(milliseconds.max())}
+      for q in self.percentiles:
+        stats['p%d_ms' % q] = float(np.percentile(milliseconds, q))
+      for key, values in self.stage_memory.get(stage, {}).items():
+        values = np.array(values)
+        stats['max_' + key] = int(values.max())
+        for q in self.percentiles:
+          stats['p%d_%s' % (q, key)] = int(np.percentile(values, q))
+      stages[stage] = stats
+    return {
+        'images': self.images,
+        'errors': self.errors,
+        'wall_seconds': wall_seconds,
+        'images_per_second': self.images / wall_seconds if wall_seconds > 0 else 0.0,
+        'stages': stages,
+    }
+
+  def write_json(self, path):
+    with open(path, 'w', encoding='utf-8') as f:
+      json.dump(self.summary(), f, indent=2)
+
+
+def process_image_safely(filepath, **process_options):
+  # one corrupt file should not abort the whole batch, so errors come back as part of the record
+  try:
+    record = process_image(filepath, **process_options)
+    record['error'] = None
+  except Exception as e:
+    record = {'image_name': os.path.basename(filepath)}
+    record.update(error_record(e))
+    record['traceback'] = traceback.format_exc()
+  return record
+
+
+# env variables read by OpenMP / BLAS libraries when a worker process starts
+THREAD_LIMIT_ENV_VARS = ['OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS',
+                         'VECLIB_MAXIMUM_THREADS', 'NUMEXPR_NUM_THREADS']
+
+
+def init_batch_worker(threads_per_worker, lut_dir=None, lut_bits=5):
+  # each process gets its own small thread budget, otherwise N workers x all-core
+  # OpenCV / BLAS thread pools fight over the same cores
+  # spawned / forkserver workers import palette.py afresh, so the parent's lookup table is
+  # memory-mapped again here (it is already on disk, nothing is rebuilt)
+  if lut_dir is not None:
+    color_name_cache.use_lut(lut_dir, lut_bits)
+  for name in THREAD_LIMIT_ENV_VARS:
+    os.environ[name] = str(threads_per_worker)
+  cv2.setNumThreads(threads_per_worker)
+  try:
+    from threadpoolctl import threadpool_limits
+    threadpool_limits(limits=threads_per_worker)
+  except ImportError:
+    pass
+
+
+def run_batch(filepaths, workers=None, threads_per_worker=1, chunksize=4, ordered=True, prefetch=8,
+              lut_dir=None, lut_bits=5, start_method=None, **process_options):
+  # yields one record per file (see process_image_safely), spreading the work over a process pool
+  # workers=None uses every core, workers=1 runs in this process (handy for debugging)
+  # ordered=False hands back records as soon as any worker finishes them
+  # with workers=1, prefetch > 0 decodes that many images ahead in background threads; with a pool
+  # the workers' own reads already overlap each other
+  # lut_dir names colors from the lookup table (see ColorNameCache), in this process and in every worker;
+  # without it the workers use whatever table this process already has
+  # start_method picks the multiprocessing start method ('fork', 'spawn', 'forkserver'), default the platform's
+  if lut_dir is not None:
+    # built here once, before any worker could race to build the same file
+    color_name_cache.use_lut(lut_dir, lut_bits)
+  if workers is None:
+    workers = os.cpu_count() or 1
+  # process_options (dominant_color_method, segmentation_method, marked_directory, profile,
+  # reduced_decode) go to process_image
+  process = functools.partial(process_image_safely, **process_options)
+
+  if workers == 1:
+    if prefetch:
+      reduced_decode = process_options.get('reduced_decode', 1)
+      prefetched = prefetch_images(filepaths, queue_size=prefetch, reduced_decode=reduced_decode)
+      while True:
+        start = time.perf_counter()
+        item = next(prefetched, None)
+        if item is None:
+          return
+        filepath, image = item
+        yield process(filepath, image=image, read_seconds=time.perf_counter() - start)
+    else:
+      for filepath in filepaths:
+        yield process(filepath)
+    return
+
+  # spawned / forkserver children pick these up before numpy and cv2 are imported
+  saved_env = {name: os.environ.get(name) for name in THREAD_LIMIT_ENV_VARS}
+  for name in THREAD_LIMIT_ENV_VARS:
+    os.environ[name] = str(threads_per_worker)
+  try:
+    worker_lut = (None, 5)
+    if color_name_cache.lut is not None:
+      worker_lut = (os.path.dirname(color_name_cache.lut_path), color_name_cache.lut_bits)
+    context = multiprocessing.get_context(start_method)
+    with context.Pool(workers, initializer=init_batch_worker, initargs=(threads_per_worker,) + worker_lut) as pool:
+      imap = pool.imap if ordered else pool.imap_unordered
+      for record in imap(process, filepaths, chunksize=chunksize):
+        yield record
+  finally:
+    for name, value in saved_env.items():
+      if value is None:
+        os.environ.pop(name, None)
+      else:
+        os.environ[name] = value
@@ -0,0 +1,83 @@
+import cv2
+import numpy as np
+
+
+def enhance_image(image):
+
+    # Convert the image to LAB color space
+    lab = cv2.cvtColor(image, cv2.COLOR_BGR2LAB)
+
+    # Split the LAB channels
+    l, a, b = cv2.split(lab)
+
+    # Enhance the L channel
+    clahe = cv2.createCLAHE(clipLimit=0.07, tileGridSize=(8, 8))
+    enhanced_l = clahe.apply(l)
+
+    # Merge the enhanced L channel with the original A and B channels
+    enhanced_lab = cv2.merge([enhanced_l, a, b])
+
+    # Convert the enhanced LAB image back to BGR color space
+    enhanced_image = cv2.cvtColor(enhanced_lab, cv2.COLOR_LAB2BGR)
+
+    return enhanced_image
+
+
+def change_resolution(image):
+  # Define the desired width and height
+  new_width = 600
+  new_height = 700
+
+  # Resize the image
+  resized_image = cv2.resize(image, (new_width, new_height))
+  return resized_image
+
+
+class PreprocessBuffers:
+    # output arrays for preprocess_image, allocated once and reused for every image
+    # (everything is resized to the same width x height, so the shapes never change)
+
+    def __init__(self, width=600, height=700, clip_limit=0.07, tile_grid_size=(8, 8)):
+        self.size = (width, height)
+        self.clahe = cv2.createCLAHE(clipLimit=clip_limit, tileGridSize=tile_grid_size)
+        self.resized = np.empty((height, width, 3), dtype=np.uint8)
+        self.lab = np.empty((height, width, 3), dtype=np.uint8)
+        self.l_channel = np.empty((height, width), dtype=np.uint8)
+        self.enhanced_l = np.empty((height, width), dtype=np.uint8)
+        self.enhanced = np.empty((height, width, 3), dtype=np.uint8)
+        self.hsv = np.empty((height, width, 3), dtype=np.uint8)
+
+
+def as_bgr_uint8(image):
+    # the pipeline works on 8-bit BGR; grayscale and BGRA images are converted, anything else
+    # is rejected instead of being passed to OpenCV calls that would silently reallocate their output
+    image = np.asarray(image)
+    if image.dtype != np.uint8:
+        raise ValueError('expected an 8-bit image, got dtype %s' % image.dtype)
+    if image.ndim == 2 or (image.ndim == 3 and image.shape[2] == 1):
+        return cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
+    if image.ndim == 3 and image.shape[2] == 4:
+        return cv2.cvtColor(image, cv2.COLOR_BGRA2BGR)
+    if image.ndim == 3 and image.shape[2] == 3:
+        return image
+    raise ValueError('expected a grayscale, BGR or BGRA image, got shape %s' % (image.shape,))
+
+
+def preprocess_image(image, buffers):
+    # change_resolution + enhance_image in one pass, resizing first so CLAHE and the LAB
+    # round trip run on 600x700 pixels instead of the original image
+    # the returned array is buffers.enhanced, it is overwritten by the next call
+    image = as_bgr_uint8(image)
+
+    # OpenCV only writes into dst when the shape and type match, so keep what each call returns
+    resized = cv2.resize(image, buffers.size, dst=buffers.resized)
+    lab = cv2.cvtColor(resized, cv2.COLOR_BGR2LAB, dst=buffers.lab)
+
+    # Enhance the L channel and put it back in place
+    l_channel = cv2.extractChannel(lab, 0, dst=buffers.l_channel)
+    enhanced_l = buffers.clahe.apply(l_channel, dst=buffers.enhanced_l)
+    lab = cv2.insertChannel(enhanced_l, lab, 0)
+
+    enhanced = cv2.cvtColor(lab, cv2.COLOR_LAB2BGR, dst=buffers.enhanced)
+    assert enhanced is buffers.enhanced
+    return enhanced
@@ -0,0 +1,173 @@
+import os
+import csv
+import glob
+import json
+import re
+
+import pandas as pd
+
+
+RESULT_COLUMNS = ['image_name', 'rgb_code_tuple', 'color_name', 'color_family_name']
+
+
+def drop_partial_last_line(path):
+  # a crash mid-write can leave half a record at the end of a text file, cut it off before appending
+  with open(path, 'rb+') as f:
+    data = f.read()
+    if data and not data.endswith(b'\n'):
+      f.truncate(data.rfind(b'\n') + 1)
+
+
+class CsvResultsWriter:
+  # appends one csv row per record and flushes it, so a crashed run keeps everything written so far
+
+  def __init__(self, path):
+    self.path = path
+    resuming = os.path.exists(path) and os.path.getsize(path) > 0
+    if resuming:
+      drop_partial_last_line(path)
+    self.file = open(path, 'a', newline='', encoding='utf-8')
+    self.writer = csv.DictWriter(self.file, fieldnames=RESULT_COLUMNS, extrasaction='ignore')
+    if not resuming:
+      self.writer.writeheader()
+      self.file.flush()
+
+  def completed_image_names(self):
+    with open(self.path, newline='', encoding='utf-8') as f:
+      return {row['image_name'] for row in csv.DictReader(f)}
+
+  def write(self, record):
+    row = dict(record)
+    row['rgb_code_tuple'] = str(tuple(record['rgb_code_tuple']))
+    self.writer.writerow(row)
+    self.file.flush()
+
+  def close(self):
+    self.file.close()
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *exc_info):
+    self.close()
+
+
+class JsonLinesResultsWriter:
+  # appends one json object per line and flushes it
+
+  def __init__(self, path):
+    self.path = path
+    if os.path.exists(path):
+      drop_partial_last_line(path)
+    self.file = open(path, 'a', encoding='utf-8')
+
+  def completed_image_names(self):
+    with open(self.path, encoding='utf-8') as f:
+      return {json.loads(line)['image_name'] for line in f if line.strip()}
+
+  def write(self, record):
+    row = {column: record[column] for column in RESULT_COLUMNS}
+    row['rgb_code_tuple'] = list(record['rgb_code_tuple'])
+    self.file.write(json.dumps(row) + '\n')
+    self.file.flush()
+
+  def close(self):
+    self.file.close()
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *exc_info):
+    self.close()
+
+
+PART_NAME = re.compile(r'part-(\d+)\.parquet$')
+
+
+class ParquetResultsWriter:
+  # buffers records and writes every batch_size of them as a new part file inside the path directory
+  # parts are written to a temp name and renamed, so a crash only loses the batch still in memory
+
+  def __init__(self, path, batch_size=1000):
+    self.path = path
+    self.batch_size = batch_size
+    self.buffer = []
+    os.makedirs(path, exist_ok=True)
+    # one past the highest existing part, not the number of parts: after a part was deleted by hand
+    # the count would point at an existing file, which the next flush would replace
+    part_numbers = [int(PART_NAME.match(os.path.basename(part_path)).group(1))
+                    for part_path in self.part_paths()]
+    self.part_number = max(part_numbers, default=-1) + 1
+
+  def part_paths(self):
+    return sorted(part_path for part_path in glob.glob(os.path.join(self.path, 'part-*.parquet'))
+                  if PART_NAME.match(os.path.basename(part_path)))
+
+  def completed_image_names(self):
+    names = set()
+    for part_path in self.part_paths():
+      names.update(pd.read_parquet(part_path, columns=['image_name'])['image_name'])
+    return names
+
+  def write(self, record):
+    row = {column: record[column] for column in RESULT_COLUMNS}
+    row['rgb_code_tuple'] = str(tuple(record['rgb_code_tuple']))
+    self.buffer.append(row)
+    if len(self.buffer) >= self.batch_size:
+      self.flush()
+
+  def flush(self):
+    if not self.buffer:
+      return
+    part_path = os.path.join(self.path, 'part-%05d.parquet' % self.part_number)
+    tmp_path = part_path + '.tmp'
+    pd.DataFrame(self.buffer, columns=RESULT_COLUMNS).to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, part_path)
+    self.part_number += 1
+    self.buffer = []
+
+  def close(self):
+    self.flush()
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *exc_info):
+    self.close()
+
+
+def open_results_writer(path, **kwargs):
+  # picks the writer from the extension: .csv, .jsonl or .parquet (a directory of part files)
+  extension = os.path.splitext(path)[1].lower()
+  if extension == '.csv':
+    return CsvResultsWriter(path, **kwargs)
+  if extension == '.jsonl':
+    return JsonLinesResultsWriter(path, **kwargs)
+  if extension == '.parquet':
+    return ParquetResultsWriter(path, **kwargs)
+  raise ValueError('unsupported results format: ' + path)
+
+
+def read_results(path):
+  extension = os.path.splitext(path)[1].lower()
+  if extension == '.csv':
+    return pd.read_csv(path)
+  if extension == '.jsonl':
+    if os.path.getsize(path) == 0:
+      return pd.DataFrame(columns=RESULT_COLUMNS)
+    df = pd.read_json(path, lines=True)
+    df['rgb_code_tuple'] = df['rgb_code_tuple'].map(lambda rgb: str(tuple(rgb)))
+    return df
+  if extension == '.parquet':
+    parts = sorted(glob.glob(os.path.join(path, 'part-*.parquet')))
+    if not parts:
+      return pd.DataFrame(columns=RESULT_COLUMNS)
+    return pd.concat([pd.read_parquet(part) for part in parts], ignore_index=True)
+  raise ValueError('unsupported results format: ' + path)
+
+
+def export_results_to_excel(results_path, excel_path):
+  # single final step, instead of rewriting the whole excel file after every image
+  df = read_results(results_path)
+  df.to_excel(excel_path, index=False)
+  return df
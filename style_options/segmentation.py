@@ -0,0 +1,173 @@
+import time
+
+import cv2
+import numpy as np
+import pandas as pd
+
+
+def grabcut_foreground(mask):
+    # Create a binary mask where the foreground is labeled as likely or definite foreground
+    # GC_FGD (1) and GC_PR_FGD (3) are exactly the odd labels
+    foreground_mask = mask & 1
+    foreground_mask *= 255
+    return foreground_mask
+
+
+def run_grabcut(image, rect, iterations=5, min_change=None):
+    # min_change=None runs all iterations in one call, like before
+    # otherwise grabcut runs one iteration at a time and stops early once less than
+    # min_change of the pixels flip between foreground and background
+    mask = np.zeros(image.shape[:2], dtype=np.uint8)
+    bgdModel = np.zeros((1, 65), np.float64)
+    fgdModel = np.zeros((1, 65), np.float64)
+
+    if min_change is None:
+        mask, bgdModel, fgdModel = cv2.grabCut(image, mask, rect, bgdModel, fgdModel, iterations, cv2.GC_INIT_WITH_RECT)
+        return grabcut_foreground(mask)
+
+    mask, bgdModel, fgdModel = cv2.grabCut(image, mask, rect, bgdModel, fgdModel, 1, cv2.GC_INIT_WITH_RECT)
+    foreground_mask = grabcut_foreground(mask)
+    for _ in range(iterations - 1):
+        mask, bgdModel, fgdModel = cv2.grabCut(image, mask, None, bgdModel, fgdModel, 1, cv2.GC_EVAL)
+        new_foreground_mask = grabcut_foreground(mask)
+        changed = np.count_nonzero(new_foreground_mask != foreground_mask) / foreground_mask.size
+        foreground_mask = new_foreground_mask
+        if changed < min_change:
+            break
+    return foreground_mask
+
+
+def garment_mask_using_grabcut(image, iterations=5, min_change=None, timings=None):
+    # Define the rectangle region that contains the garment
+    h, w = image.shape[:2]
+    rect = (10, 10, w-20, h-20)
+
+    start = time.perf_counter()
+    foreground_mask = run_grabcut(image, rect, iterations, min_change)
+    if timings is not None:
+        timings['grabcut'] = time.perf_counter() - start
+    return foreground_mask
+
+
+def garment_mask_using_grabcut_early_exit(image, iterations=5, min_change=0.001, timings=None):
+    return garment_mask_using_grabcut(image, iterations, min_change, timings)
+
+
+def garment_mask_using_lowres_grabcut(image, pyramid_levels=2, iterations=5, min_change=None,
+                                      refine_iterations=1, timings=None):
+    # grabcut on a pyrDown level of the image, then the mask is scaled back up
+    # refine_iterations > 0 runs that many full resolution grabcut iterations, seeded with the
+    # upscaled mask, to snap the garment edge back to full resolution detail
+    if timings is None:
+        timings = {}
+    h, w = image.shape[:2]
+
+    start = time.perf_counter()
+    small_image = image
+    for _ in range(pyramid_levels):
+        small_image = cv2.pyrDown(small_image)
+    timings['downscale'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    small_h, small_w = small_image.shape[:2]
+    margin = max(1, 10 >> pyramid_levels)
+    rect = (margin, margin, small_w - 2 * margin, small_h - 2 * margin)
+    small_mask = run_grabcut(small_image, rect, iterations, min_change)
+    timings['grabcut'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    foreground_mask = cv2.resize(small_mask, (w, h), interpolation=cv2.INTER_LINEAR)
+    foreground_mask = np.where(foreground_mask >= 128, 255, 0).astype(np.uint8)
+    timings['upscale'] = time.perf_counter() - start
+
+    if refine_iterations > 0 and foreground_mask.any():
+        start = time.perf_counter()
+        # only the band around the upscaled edge is uncertain, the rest keeps its label
+        band = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (4 * pyramid_levels + 1, 4 * pyramid_levels + 1))
+        sure_foreground = cv2.erode(foreground_mask, band) > 0
+        maybe_foreground = foreground_mask > 0
+        maybe_background = cv2.dilate(foreground_mask, band) > 0
+        mask = np.full((h, w), cv2.GC_BGD, dtype=np.uint8)
+        mask[maybe_background] = cv2.GC_PR_BGD
+        mask[maybe_foreground] = cv2.GC_PR_FGD
+        mask[sure_foreground] = cv2.GC_FGD
+        bgdModel = np.zeros((1, 65), np.float64)
+        fgdModel = np.zeros((1, 65), np.float64)
+        mask, bgdModel, fgdModel = cv2.grabCut(image, mask, None, bgdModel, fgdModel, refine_iterations, cv2.GC_INIT_WITH_MASK)
+        foreground_mask = grabcut_foreground(mask)
+        timings['refine'] = time.perf_counter() - start
+    return foreground_mask
+
+
+def garment_mask_using_threshold(image, timings=None):
+    # cheap fallback for plain studio backgrounds: the background color is taken from the image
+    # border, pixels far enough from it (otsu threshold) are garment, and the largest blob is kept
+    start = time.perf_counter()
+    lab = cv2.cvtColor(image, cv2.COLOR_BGR2LAB).astype(np.float32)
+    border = np.concatenate([lab[:10].reshape(-1, 3), lab[-10:].reshape(-1, 3),
+                             lab[:, :10].reshape(-1, 3), lab[:, -10:].reshape(-1, 3)])
+    background_lab = np.median(border, axis=0)
+    distance = np.sqrt(np.sum((lab - background_lab) ** 2, axis=2))
+    distance = cv2.normalize(distance, None, 0, 255, cv2.NORM_MINMAX).astype(np.uint8)
+    _, foreground_mask = cv2.threshold(distance, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+
+    kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (7, 7))
+    foreground_mask = cv2.morphologyEx(foreground_mask, cv2.MORPH_OPEN, kernel)
+    foreground_mask = cv2.morphologyEx(foreground_mask, cv2.MORPH_CLOSE, kernel)
+
+    contours, _ = cv2.findContours(foreground_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    foreground_mask = np.zeros_like(foreground_mask)
+    if contours:
+        largest = max(contours, key=cv2.contourArea)
+        cv2.drawContours(foreground_mask, [largest], -1, 255, thickness=cv2.FILLED)
+    if timings is not None:
+        timings['threshold'] = time.perf_counter() - start
+    return foreground_mask
+
+
+# name -> function taking a BGR image and returning its 0/255 garment mask
+SEGMENTATION_METHODS = {
+    'grabcut': garment_mask_using_grabcut,
+    'grabcut_early_exit': garment_mask_using_grabcut_early_exit,
+    'grabcut_lowres': garment_mask_using_lowres_grabcut,
+    'threshold': garment_mask_using_threshold,
+}
+
+
+def get_garment_mask(image, method='grabcut'):
+    return SEGMENTATION_METHODS[method](image)
+
+
+def segment_garment(image, method='grabcut'):
+    foreground_mask = get_garment_mask(image, method=method)
+
+    # Apply the binary mask to extract the garment object
+    segmented_image = cv2.bitwise_and(image, image, mask=foreground_mask)
+
+    return segmented_image
+
+
+def mask_iou(mask1, mask2):
+    intersection = np.count_nonzero((mask1 > 0) & (mask2 > 0))
+    union = np.count_nonzero((mask1 > 0) | (mask2 > 0))
+    return intersection / union if union else 1.0
+
+
+def compare_segmentation_methods(images, methods=None, reference='grabcut'):
+    # per-stage timings and mask IoU against the reference method on already resized images
+    # returns one row per (image, method) so the speed / quality tradeoff can be picked per catalog
+    if methods is None:
+        methods = list(SEGMENTATION_METHODS)
+    rows = []
+    for image_number, image in enumerate(images):
+        masks = {}
+        for method in [reference] + [m for m in methods if m != reference]:
+            timings = {}
+            start = time.perf_counter()
+            masks[method] = SEGMENTATION_METHODS[method](image, timings=timings)
+            row = {'image': image_number, 'method': method,
+                   'total_ms': 1000 * (time.perf_counter() - start),
+                   'iou': mask_iou(masks[method], masks[reference])}
+            row.update({stage + '_ms': 1000 * seconds for stage, seconds in timings.items()})
+            rows.append(row)
+    return pd.DataFrame(rows)
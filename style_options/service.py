@@ -0,0 +1,289 @@
+import json
+import time
+import queue
+import logging
+import threading
+import urllib.request
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import cv2
+import numpy as np
+
+from .palette import color_name_cache
+from .pipeline import (StageTimer, analyze_dominant_color, analyze_images, error_record,
+                       name_dominant_colors)
+from .benchmark import make_synthetic_garment
+
+logger = logging.getLogger(__name__)
+
+
+class ServiceMetrics:
+  # request latencies over a sliding window plus counters, shared by all handler threads
+
+  def __init__(self, window=10000):
+    self._lock = threading.Lock()
+    self.latencies = deque(maxlen=window)
+    self.batch_sizes = deque(maxlen=window)
+    self.requests = 0
+    self.errors = 0
+    self.start = time.time()
+
+  def record_request(self, seconds, error=False):
+    with self._lock:
+      self.requests += 1
+      self.errors += int(error)
+      self.latencies.append(seconds)
+
+  def record_batch(self, size):
+    with self._lock:
+      self.batch_sizes.append(size)
+
+  @staticmethod
+  def color_naming_info():
+    # the service names colors in batches, which skip the LRU, so its hits / misses would stay 0
+    info = color_name_cache.cache_info()
+    return {key: info[key] for key in ('batch_lookups', 'lut_lookups', 'lut_path')}
+
+  def snapshot(self):
+    with self._lock:
+      milliseconds = 1000 * np.array(self.latencies)
+      batch_sizes = np.array(self.batch_sizes)
+      requests, errors = self.requests, self.errors
+    latency = {}
+    if len(milliseconds):
+      latency = {'mean_ms': float(milliseconds.mean()), 'max_ms': float(milliseconds.max())}
+      for q in (50, 90, 99):
+        latency['p%d_ms' % q] = float(np.percentile(milliseconds, q))
+    return {
+        'uptime_seconds': time.time() - self.start,
+        'requests': requests,
+        'errors': errors,
+        'latency': latency,
+        'mean_batch_size': float(batch_sizes.mean()) if len(batch_sizes) else 0.0,
+        'color_naming': self.color_naming_info(),
+    }
+
+
+class MicroBatcher:
+  # each request's decode, segmentation and dominant color run right away on a pool of worker threads
+  # (cv2 releases the GIL, so they run in parallel); only the color naming is batched: one naming thread
+  # names up to max_batch_size dominant colors in a single vectorized palette lookup (see
+  # name_dominant_colors) and resolves their futures straight after
+  # it waits up to max_wait_ms for a batch to fill, and only while other requests are still in their
+  # per-image stages, so a lone request is never held back
+
+  def __init__(self, workers=2, max_batch_size=8, max_wait_ms=5.0, metrics=None, profile=False, **analyze_options):
+    self.max_batch_size = max_batch_size
+    self.max_wait = max_wait_ms / 1000.0
+    self.metrics = metrics
+    self.profile = profile
+    self.analyze_options = analyze_options
+    self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='analyze')
+    self.naming_queue = queue.Queue()
+    self._lock = threading.Lock()
+    # submitted requests whose future is not resolved yet
+    self.in_progress = 0
+    self.naming_thread = threading.Thread(target=self._name_colors, daemon=True)
+    self.naming_thread.start()
+
+  def submit(self, image):
+    # image is encoded bytes or a decoded BGR ndarray; the future resolves to its analyze_images record
+    future = Future()
+    with self._lock:
+      self.in_progress += 1
+    self.executor.submit(self._analyze, image, future)
+    return future
+
+  def _analyze(self, image, future):
+    timer = StageTimer()
+    try:
+      color_bgr = analyze_dominant_color(image, timer=timer, **self.analyze_options)
+    except Exception as e:
+      self._resolve([(future, timer, error_record(e))])
+      return
+    self.naming_queue.put((color_bgr, timer, future))
+
+  def _resolve(self, results):
+    with self._lock:
+      self.in_progress -= len(results)
+    for future, timer, record in results:
+      if self.profile:
+        record['stages'] = timer.stages
+      future.set_result(record)
+
+  def _next_batch(self):
+    item = self.naming_queue.get()
+    if item is None:
+      return None
+    batch = [item]
+    deadline = time.perf_counter() + self.max_wait
+    while len(batch) < self.max_batch_size:
+      try:
+        item = self.naming_queue.get_nowait()
+      except queue.Empty:
+        with self._lock:
+          others_in_progress = self.in_progress > len(batch)
+        timeout = deadline - time.perf_counter()
+        if not others_in_progress or timeout <= 0:
+          break
+        try:
+          item = self.naming_queue.get(timeout=timeout)
+        except queue.Empty:
+          break
+      if item is None:
+        # stop after this batch
+        self.naming_queue.put(None)
+        break
+      batch.append(item)
+    return batch
+
+  def _name_colors(self):
+    while True:
+      batch = self._next_batch()
+      if batch is None:
+        return
+      colors, timers, futures = zip(*batch)
+      try:
+        records = name_dominant_colors(colors, timers)
+      except Exception as e:
+        records = [error_record(e) for _ in batch]
+      self._resolve(list(zip(futures, timers, records)))
+      if self.metrics is not None:
+        self.metrics.record_batch(len(batch))
+
+  def close(self):
+    self.executor.shutdown(wait=True)
+    self.naming_queue.put(None)
+    self.naming_thread.join()
+
+
+class AnalyzeRequestHandler(BaseHTTPRequestHandler):
+  # POST /analyze with the image file as the request body -> json color record
+  # GET /metrics -> latency percentiles, batch sizes and color naming counters; GET /health -> ok
+
+  def do_GET(self):
+    if self.path == '/health':
+      self.send_json(200, {'status': 'ok'})
+    elif self.path == '/metrics':
+      self.send_json(200, self.server.metrics.snapshot())
+    else:
+      self.send_json(404, {'error': 'not found'})
+
+  def do_POST(self):
+    # 400 for a missing or malformed body, 422 when the image cannot be analyzed, and 503 when the
+    # request timed out waiting for a worker, so clients can tell overload apart from a bad image
+    if self.path != '/analyze':
+      self.send_json(404, {'error': 'not found'})
+      return
+    start = time.perf_counter()
+    try:
+      content_length = int(self.headers.get('Content-Length', 0))
+    except ValueError:
+      content_length = -1
+    if content_length < 0:
+      self.send_json(400, {'error': 'invalid Content-Length header'})
+      return
+    data = self.rfile.read(content_length)
+    if not data:
+      self.send_json(400, {'error': 'empty request body, send the image file'})
+      return
+    status = 200
+    try:
+      record = self.server.batcher.submit(data).result(timeout=self.server.request_timeout)
+    except FutureTimeoutError:
+      status = 503
+      record = {'error': 'timed out after %g s waiting for a worker' % self.server.request_timeout}
+    except Exception as e:
+      status = 503
+      record = {'error': '%s: %s' % (type(e).__name__, e)}
+    error = record.get('error') is not None
+    if error and status == 200:
+      status = 422
+    self.server.metrics.record_request(time.perf_counter() - start, error=error)
+    self.send_json(status, record)
+
+  def send_json(self, status, payload):
+    body = json.dumps(payload).encode('utf-8')
+    self.send_response(status)
+    self.send_header('Content-Type', 'application/json')
+    self.send_header('Content-Length', str(len(body)))
+    self.end_headers()
+    self.wfile.write(body)
+
+  def log_message(self, format, *args):
+    logger.debug('%s - ' + format, self.address_string(), *args)
+
+
+def make_server(host='127.0.0.1', port=8000, workers=2, max_batch_size=8, max_wait_ms=5.0,
+                request_timeout=60.0, lut_dir=None, lut_bits=5, **analyze_options):
+  # builds the http server with warm state: the palette index is loaded at import, the lookup table
+  # (with lut_dir) is memory-mapped, and one synthetic garment goes through every stage before the
+  # first real request so lazy initialization does not land on a user's latency
+  if lut_dir is not None:
+    color_name_cache.use_lut(lut_dir, lut_bits)
+  analyze_images([make_synthetic_garment(np.random.default_rng(0))[0]], **analyze_options)
+
+  server = ThreadingHTTPServer((host, port), AnalyzeRequestHandler)
+  server.daemon_threads = True
+  server.metrics = ServiceMetrics()
+  server.batcher = MicroBatcher(workers, max_batch_size, max_wait_ms, metrics=server.metrics, **analyze_options)
+  server.request_timeout = request_timeout
+  return server
+
+
+def serve(host='127.0.0.1', port=8000, **server_options):
+  server = make_server(host, port, **server_options)
+  logger.info('serving on http://%s:%d', host, port)
+  try:
+    server.serve_forever()
+  except KeyboardInterrupt:
+    pass
+  finally:
+    server.server_close()
+    server.batcher.close()
+
+
+def run_load_test(url, payloads, requests=200, concurrency=8, timeout=60.0):
+  # posts payloads (encoded images, reused round robin) to url/analyze from concurrency threads
+  # and reports throughput and client side latency percentiles
+  analyze_url = url.rstrip('/') + '/analyze'
+
+  def post(n):
+    request = urllib.request.Request(analyze_url, data=payloads[n % len(payloads)], method='POST',
+                                     headers={'Content-Type': 'application/octet-stream'})
+    start = time.perf_counter()
+    try:
+      with urllib.request.urlopen(request, timeout=timeout) as response:
+        response.read()
+      ok = True
+    except Exception:
+      ok = False
+    return time.perf_counter() - start, ok
+
+  start = time.perf_counter()
+  with ThreadPoolExecutor(max_workers=concurrency) as executor:
+    results = list(executor.map(post, range(requests)))
+  wall_seconds = time.perf_counter() - start
+
+  milliseconds = 1000 * np.array([seconds for seconds, _ in results])
+  summary = {
+      'requests': requests,
+      'concurrency': concurrency,
+      'errors': sum(1 for _, ok in results if not ok),
+      'wall_seconds': wall_seconds,
+      'requests_per_second': requests / wall_seconds,
+      'mean_ms': float(milliseconds.mean()),
+      'max_ms': float(milliseconds.max()),
+  }
+  for q in (50, 90, 99):
+    summary['p%d_ms' % q] = float(np.percentile(milliseconds, q))
+  return summary
+
+
+def synthetic_payloads(n=8, seed=0):
+  # jpeg encoded synthetic garments, for load testing without a catalog
+  rng = np.random.default_rng(seed)
+  return [cv2.imencode('.jpg', make_synthetic_garment(rng)[0])[1].tobytes() for _ in range(n)]
@@ -0,0 +1,63 @@
+import os
+
+import numpy as np
+import pytest
+
+from style_options.palette import ColorNameCache, PaletteIndex, custom_color_family, custom_colors, palette_index
+
+COLORS = [(40, 160, 40), (200, 30, 30), (30, 30, 200)]
+
+
+def small_palette(**extra_colors):
+    # building a table over the full palette takes seconds, a few dozen colors are enough here
+    colors = dict(list(custom_colors.items())[::20], **extra_colors)
+    family = {name: custom_color_family.get(name, 'green') for name in colors}
+    return PaletteIndex(colors, family)
+
+
+def test_lru_counts_hits_and_misses_and_evicts_at_maxsize():
+    cache = ColorNameCache(palette_index, maxsize=2)
+    names = [cache.closest_color_name(color) for color in COLORS]
+    assert names == palette_index.closest_color_names(COLORS)
+    assert cache.cache_info()['misses'] == 3
+    assert cache.cache_info()['size'] == 2
+
+    # the first color was evicted, the last one is still cached
+    cache.closest_color_name(COLORS[2])
+    cache.closest_color_name(COLORS[0])
+    info = cache.cache_info()
+    assert (info['hits'], info['misses'], info['size']) == (1, 4, 2)
+
+    cache.clear()
+    assert cache.cache_info()['hits'] == cache.cache_info()['size'] == 0
+
+
+def test_lut_is_saved_then_memory_mapped(tmp_path):
+    cache = ColorNameCache(small_palette(), lut_dir=str(tmp_path))
+    assert os.path.exists(cache.lut_path)
+    assert os.listdir(str(tmp_path)) == [os.path.basename(cache.lut_path)]
+
+    reloaded = ColorNameCache(cache.palette_index, lut_dir=str(tmp_path))
+    assert reloaded.lut_path == cache.lut_path
+    assert isinstance(reloaded.lut, np.memmap)
+    np.testing.assert_array_equal(reloaded.lut, cache.lut)
+    assert reloaded.closest_color_names(COLORS) == cache.closest_color_names(COLORS)
+    assert reloaded.cache_info()['lut_lookups'] == len(COLORS)
+
+
+def test_lut_is_rebuilt_when_the_palette_changes(tmp_path):
+    cache = ColorNameCache(small_palette(), lut_dir=str(tmp_path))
+    changed = ColorNameCache(small_palette(**{'test green': (40, 160, 40)}), lut_dir=str(tmp_path))
+
+    assert changed.lut_path != cache.lut_path
+    assert len(os.listdir(str(tmp_path))) == 2
+    assert changed.closest_color_name((40, 160, 40)) == 'test green'
+
+
+def test_lut_bits(tmp_path):
+    cache = ColorNameCache(small_palette())
+    cache.use_lut(str(tmp_path), lut_bits=6)
+    assert cache.lut.shape == (64, 64, 64)
+    assert '6bit' in os.path.basename(cache.lut_path)
+    with pytest.raises(ValueError):
+        cache.use_lut(str(tmp_path), lut_bits=9)
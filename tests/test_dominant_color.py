@@ -0,0 +1,27 @@
+import numpy as np
+import pytest
+
+from style_options.benchmark import make_synthetic_garment
+from style_options.dominant_color import DOMINANT_COLOR_METHODS, compare_dominant_color_methods, get_dominant_bgr
+from style_options.preprocess import change_resolution
+from style_options.segmentation import segment_garment
+
+
+@pytest.fixture(scope='module')
+def segmented_garments():
+    rng = np.random.default_rng(0)
+    return [segment_garment(change_resolution(make_synthetic_garment(rng)[0]), method='threshold')
+            for _ in range(6)]
+
+
+def test_fast_methods_agree_with_meanshift(segmented_garments):
+    df = compare_dominant_color_methods(segmented_garments).set_index('method')
+    assert sorted(df.index) == sorted(DOMINANT_COLOR_METHODS)
+    for method in ('histogram', 'meanshift_subsample', 'kmeans'):
+        assert df.loc[method, 'family_agreement'] == 1.0, method
+
+
+def test_empty_mask_is_rejected():
+    image = make_synthetic_garment(np.random.default_rng(0))[0]
+    with pytest.raises(ValueError):
+        get_dominant_bgr(image, mask=np.zeros(image.shape[:2], dtype=np.uint8))
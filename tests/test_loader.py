@@ -0,0 +1,70 @@
+import cv2
+import numpy as np
+import pytest
+
+from style_options.cli import run_directory
+from style_options.loader import iter_image_paths
+from style_options import pipeline
+from style_options.pipeline import run_batch
+from style_options.results import read_results
+
+
+def write_image(path):
+    image = np.full((800, 700, 3), 235, dtype=np.uint8)
+    cv2.rectangle(image, (150, 120), (550, 700), (40, 160, 40), -1)
+    cv2.imwrite(str(path), image)
+
+
+def test_subdirectories_are_not_walked_by_default(tmp_path):
+    write_image(tmp_path / 'front.jpg')
+    (tmp_path / 'sku2').mkdir()
+    write_image(tmp_path / 'sku2' / 'front.jpg')
+
+    assert list(iter_image_paths(str(tmp_path))) == [str(tmp_path / 'front.jpg')]
+    assert len(list(iter_image_paths(str(tmp_path), recursive=True))) == 2
+
+
+def test_rerun_skips_completed_images(tmp_path):
+    images = tmp_path / 'images'
+    images.mkdir()
+    for name in ('a.jpg', 'b.jpg'):
+        write_image(images / name)
+    (images / 'nested').mkdir()
+    write_image(images / 'nested' / 'a.jpg')
+    results_path = str(tmp_path / 'results.csv')
+
+    options = dict(workers=1, segmentation_method='threshold', dominant_color_method='histogram')
+    first = run_directory(str(images), results_path, **options)
+    second = run_directory(str(images), results_path, **options)
+    assert first['images'] == 2
+    assert second['images'] == 0
+    assert sorted(read_results(results_path)['image_name']) == ['a.jpg', 'b.jpg']
+
+
+@pytest.mark.parametrize('workers, prefetch', [(1, 8), (1, 0), (2, 8)])
+def test_unreadable_image_is_reported(tmp_path, workers, prefetch):
+    write_image(tmp_path / 'good.jpg')
+    (tmp_path / 'corrupt.jpg').write_bytes(b'not a jpeg')
+    filepaths = sorted(iter_image_paths(str(tmp_path)))
+
+    records = list(run_batch(filepaths, workers=workers, prefetch=prefetch, segmentation_method='threshold',
+                             dominant_color_method='histogram'))
+    errors = {record['image_name']: record['error'] for record in records}
+    assert errors['good.jpg'] is None
+    assert 'could not read image' in errors['corrupt.jpg']
+
+
+def test_prefetched_unreadable_image_is_not_read_again(tmp_path, monkeypatch):
+    write_image(tmp_path / 'good.jpg')
+    (tmp_path / 'corrupt.jpg').write_bytes(b'not a jpeg')
+    filepaths = sorted(iter_image_paths(str(tmp_path)))
+
+    def read_image(filepath, reduced_decode=1):
+        raise AssertionError('read again on the critical path: ' + filepath)
+    monkeypatch.setattr(pipeline, 'read_image', read_image)
+
+    records = list(run_batch(filepaths, workers=1, profile=True, segmentation_method='threshold',
+                             dominant_color_method='histogram'))
+    assert 'could not read image' in records[0]['error']
+    assert records[1]['error'] is None
+    assert records[1]['stages']['read']['seconds'] >= 0
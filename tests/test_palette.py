@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from style_options.palette import PaletteIndex, custom_colors, custom_color_family
+
+colormath = pytest.importorskip('colormath')
+from colormath.color_objects import sRGBColor, LabColor  # noqa: E402
+from colormath.color_conversions import convert_color  # noqa: E402
+from colormath import color_diff_matrix  # noqa: E402
+
+
+def colormath_lab(color_rgb):
+    r, g, b = color_rgb
+    return np.array(convert_color(sRGBColor(r, g, b, is_upscaled=True), LabColor).get_value_tuple())
+
+
+def closest_color_name_per_entry(color_bgr, palette_lab):
+    # the original loop over custom_colors, with colormath's own CIEDE2000
+    # (color_diff_matrix is what colormath.color_diff.delta_e_cie2000 calls, minus numpy.asscalar)
+    query_lab = colormath_lab(color_bgr[::-1])
+    min_distance = float('inf')
+    closest_color = None
+    for color_name, color_lab in palette_lab.items():
+        distance = color_diff_matrix.delta_e_cie2000(query_lab, color_lab[None, :])[0]
+        if distance < min_distance:
+            min_distance = distance
+            closest_color = color_name
+    return closest_color
+
+
+def test_palette_lab_matches_colormath():
+    index = PaletteIndex(custom_colors, custom_color_family)
+    expected = np.array([colormath_lab(rgb) for rgb in custom_colors.values()])
+    np.testing.assert_allclose(index.palette_lab, expected, atol=1e-9)
+
+
+def test_closest_color_names_match_per_entry_loop():
+    index = PaletteIndex(custom_colors, custom_color_family, chunk_size=7)
+    palette_lab = {name: colormath_lab(rgb) for name, rgb in custom_colors.items()}
+    rng = np.random.default_rng(0)
+    queries = np.vstack([rng.integers(0, 256, (40, 3)), [[0, 0, 0], [255, 255, 255], [0, 0, 255]]])
+
+    expected = [closest_color_name_per_entry(tuple(color), palette_lab) for color in queries]
+    assert index.closest_color_names(queries) == expected
+    assert index.closest_color_name(tuple(queries[0])) == expected[0]
+    assert index.closest_color_families(queries) == [custom_color_family[name] for name in expected]
@@ -0,0 +1,62 @@
+import cv2
+import numpy as np
+import pytest
+
+from style_options.palette import color_name_cache, palette_index
+from style_options.pipeline import analyze_image, run_batch
+
+
+def garment(color_bgr, background=235):
+    image = np.full((800, 700, 3), background, dtype=np.uint8)
+    cv2.rectangle(image, (150, 120), (550, 700), color_bgr, -1)
+    return image
+
+
+def analyze(image):
+    return analyze_image(image, dominant_color_method='histogram', segmentation_method='threshold')
+
+
+def test_grayscale_after_color_image_is_not_the_previous_result():
+    green = analyze(garment((40, 160, 40)))
+    gray_image = cv2.cvtColor(garment((90, 90, 90)), cv2.COLOR_BGR2GRAY)
+    gray = analyze(gray_image)
+    assert gray['rgb_code_tuple'] != green['rgb_code_tuple']
+    red, green_channel, blue = gray['rgb_code_tuple']
+    assert max(red, green_channel, blue) - min(red, green_channel, blue) <= 2
+
+
+def test_bgra_matches_bgr():
+    image = garment((40, 160, 40))
+    analyze(garment((200, 30, 30)))
+    assert analyze(cv2.cvtColor(image, cv2.COLOR_BGR2BGRA)) == analyze(image)
+
+
+def test_float_image_is_rejected():
+    with pytest.raises(ValueError):
+        analyze(garment((40, 160, 40)).astype(np.float32))
+
+
+@pytest.fixture
+def restore_color_name_cache():
+    saved = color_name_cache.lut, color_name_cache.lut_path, color_name_cache.lut_bits
+    yield color_name_cache
+    color_name_cache.lut, color_name_cache.lut_path, color_name_cache.lut_bits = saved
+
+
+def test_spawned_workers_use_the_lookup_table(tmp_path, restore_color_name_cache):
+    rng = np.random.default_rng(3)
+    filepaths = []
+    for n, color in enumerate(rng.integers(0, 256, (12, 3))):
+        filepaths.append(str(tmp_path / ('g%d.png' % n)))
+        cv2.imwrite(filepaths[-1], garment(tuple(int(c) for c in color)))
+    options = dict(segmentation_method='threshold', dominant_color_method='histogram')
+
+    records = list(run_batch(filepaths, workers=2, start_method='spawn', lut_dir=str(tmp_path / 'lut'),
+                             **options))
+    assert all(record['error'] is None for record in records)
+    colors_bgr = [record['rgb_code_tuple'][::-1] for record in records]
+    lut_names = [palette_index.color_names[i] for i in color_name_cache.lookup_lut(colors_bgr)]
+    exact_names = palette_index.closest_color_names(colors_bgr)
+    assert [record['color_name'] for record in records] == lut_names
+    # the table is lossy, so a worker that fell back to the exact search would show up here
+    assert lut_names != exact_names
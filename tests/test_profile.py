@@ -0,0 +1,63 @@
+import json
+import tracemalloc
+
+import numpy as np
+
+from style_options.benchmark import run_benchmark
+from style_options.pipeline import RunProfile, StageTimer
+
+
+def test_stage_timer_records_each_stage():
+    timer = StageTimer()
+    with timer.stage('decode'):
+        pass
+    with timer.stage('segment_garment'):
+        pass
+    assert list(timer.stages) == ['decode', 'segment_garment']
+    assert set(timer.stages['decode']) == {'seconds'}
+    assert timer.stages['decode']['seconds'] >= 0
+
+
+def test_stage_timer_tracks_memory():
+    was_tracing = tracemalloc.is_tracing()
+    timer = StageTimer(track_memory=True)
+    with timer.stage('allocate'):
+        buffer = np.ones(4 * 1024 * 1024, dtype=np.uint8)
+    del buffer
+    if not was_tracing:
+        tracemalloc.stop()
+    stats = timer.stages['allocate']
+    assert stats['traced_peak_bytes'] >= 4 * 1024 * 1024
+    assert {'rss_bytes', 'rss_growth_bytes', 'max_rss_growth_bytes'} <= set(stats)
+    assert stats['rss_bytes'] > 0
+
+
+def test_run_profile_summary():
+    profile = RunProfile()
+    for n in range(1, 11):
+        profile.add({'error': None, 'stages': {'read': {'seconds': n / 1000, 'rss_bytes': n}}})
+    profile.add({'error': 'ValueError: could not read image'})
+    summary = profile.summary()
+
+    assert (summary['images'], summary['errors']) == (10, 1)
+    read = summary['stages']['read']
+    assert read['count'] == 10
+    assert {'mean_ms', 'max_ms', 'p50_ms', 'p90_ms', 'p99_ms'} <= set(read)
+    assert read['max_ms'] == 10.0
+    assert read['p50_ms'] == 5.5
+    assert (read['max_rss_bytes'], read['p50_rss_bytes']) == (10, 5)
+    assert summary['stages']['total']['count'] == 10
+
+
+def test_run_benchmark(tmp_path):
+    report_path = str(tmp_path / 'report.json')
+    df = run_benchmark(n_images=2, segmentation_methods=('threshold',), dominant_color_methods=('histogram',),
+                       report_path=report_path)
+    assert len(df) == 1
+    row = df.iloc[0]
+    assert (row['segmentation_method'], row['dominant_color_method'], row['errors']) == ('threshold', 'histogram', 0)
+    assert row['family_accuracy'] == 1.0
+    with open(report_path) as f:
+        report = json.load(f)
+    assert report['n_images'] == 2
+    assert 'p90_ms' in report['results'][0]['stages']['total']
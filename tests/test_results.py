@@ -0,0 +1,60 @@
+import os
+
+import pytest
+
+from style_options.results import RESULT_COLUMNS, open_results_writer, read_results
+
+RECORDS = [
+    {'image_name': 'g%d.jpg' % n, 'rgb_code_tuple': (10, 20, n), 'color_name': 'red',
+     'color_family_name': 'red', 'error': None}
+    for n in range(3)
+]
+
+
+@pytest.mark.parametrize('extension', ['csv', 'jsonl'])
+def test_resume_after_partial_line(tmp_path, extension):
+    path = str(tmp_path / ('results.' + extension))
+    with open_results_writer(path) as writer:
+        for record in RECORDS[:2]:
+            writer.write(record)
+    # a crash in the middle of the next record
+    with open(path, 'a') as f:
+        f.write('g2.jp')
+
+    with open_results_writer(path) as writer:
+        assert writer.completed_image_names() == {'g0.jpg', 'g1.jpg'}
+        writer.write(RECORDS[2])
+
+    df = read_results(path)
+    assert list(df['image_name']) == ['g0.jpg', 'g1.jpg', 'g2.jpg']
+    assert df['rgb_code_tuple'].iloc[2] == '(10, 20, 2)'
+
+
+@pytest.mark.parametrize('extension', ['csv', 'jsonl'])
+def test_read_empty_results(tmp_path, extension):
+    path = str(tmp_path / ('results.' + extension))
+    with open_results_writer(path):
+        pass
+    df = read_results(path)
+    assert df.empty
+    assert list(df.columns) == RESULT_COLUMNS
+
+
+def test_json_extension_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        open_results_writer(str(tmp_path / 'results.json'))
+
+
+def test_parquet_part_numbers_continue_after_a_gap(tmp_path):
+    path = str(tmp_path / 'results.parquet')
+    for record in RECORDS:
+        with open_results_writer(path, batch_size=1) as writer:
+            writer.write(record)
+    # part-00000 deleted by hand
+    os.remove(os.path.join(path, 'part-00000.parquet'))
+
+    with open_results_writer(path, batch_size=1) as writer:
+        assert writer.completed_image_names() == {'g1.jpg', 'g2.jpg'}
+        writer.write(dict(RECORDS[0], image_name='g3.jpg'))
+    assert sorted(os.listdir(path)) == ['part-00001.parquet', 'part-00002.parquet', 'part-00003.parquet']
+    assert sorted(read_results(path)['image_name']) == ['g1.jpg', 'g2.jpg', 'g3.jpg']
@@ -0,0 +1,47 @@
+import cv2
+import numpy as np
+import pytest
+
+from style_options.benchmark import make_synthetic_garment
+from style_options.preprocess import change_resolution
+from style_options.segmentation import (SEGMENTATION_METHODS, compare_segmentation_methods,
+                                        garment_mask_using_grabcut_early_exit, mask_iou)
+
+
+@pytest.fixture(scope='module')
+def garments():
+    rng = np.random.default_rng(0)
+    return [change_resolution(make_synthetic_garment(rng)[0]) for _ in range(3)]
+
+
+def test_mask_iou():
+    mask = np.zeros((10, 10), dtype=np.uint8)
+    mask[:, :5] = 255
+    assert mask_iou(mask, mask) == 1.0
+    assert mask_iou(mask, 255 - mask) == 0.0
+    half = mask.copy()
+    half[5:] = 0
+    assert mask_iou(mask, half) == 0.5
+
+
+def test_methods_match_full_resolution_grabcut(garments):
+    df = compare_segmentation_methods(garments)
+    assert sorted(df['method'].unique()) == sorted(SEGMENTATION_METHODS)
+    assert (df['iou'] >= 0.97).all(), df[['image', 'method', 'iou']]
+    assert (df.loc[df['method'] == 'grabcut', 'iou'] == 1.0).all()
+    assert 'grabcut_ms' in df.columns
+
+
+def test_early_exit_stops_before_all_iterations(garments, monkeypatch):
+    calls = []
+    grab_cut = cv2.grabCut
+
+    def counting_grab_cut(*args):
+        calls.append(args[-2])
+        return grab_cut(*args)
+    monkeypatch.setattr(cv2, 'grabCut', counting_grab_cut)
+
+    # default min_change, one grabcut iteration per call
+    garment_mask_using_grabcut_early_exit(garments[0], iterations=5)
+    assert 1 <= len(calls) < 5
+    assert calls == [1] * len(calls)
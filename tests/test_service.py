@@ -0,0 +1,104 @@
+import json
+import contextlib
+import http.client
+import threading
+import urllib.error
+import urllib.request
+
+import cv2
+import numpy as np
+import pytest
+
+from style_options.service import MicroBatcher, make_server
+
+
+def garment_jpeg(color_bgr):
+    image = np.full((800, 700, 3), 235, dtype=np.uint8)
+    cv2.rectangle(image, (150, 120), (550, 700), color_bgr, -1)
+    return cv2.imencode('.jpg', image)[1].tobytes()
+
+
+@contextlib.contextmanager
+def running_server(**server_options):
+    server = make_server(port=0, segmentation_method='threshold', dominant_color_method='histogram',
+                         **server_options)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+        server.batcher.close()
+
+
+@pytest.fixture
+def server_url():
+    with running_server() as server:
+        yield 'http://127.0.0.1:%d' % server.server_address[1]
+
+
+def get_json(url, data=None):
+    with urllib.request.urlopen(urllib.request.Request(url, data=data)) as response:
+        return json.loads(response.read())
+
+
+def test_metrics_count_color_naming(server_url):
+    before = get_json(server_url + '/metrics')['color_naming']['batch_lookups']
+    record = get_json(server_url + '/analyze', data=garment_jpeg((40, 160, 40)))
+    assert record['error'] is None
+    metrics = get_json(server_url + '/metrics')
+    assert metrics['requests'] == 1
+    assert metrics['color_naming']['batch_lookups'] == before + 1
+    assert 'hits' not in metrics['color_naming']
+
+
+def post_status(url, data):
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url + '/analyze', data=data)) as response:
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+
+
+def test_status_codes(server_url):
+    assert post_status(server_url, garment_jpeg((40, 160, 40))) == 200
+    assert post_status(server_url, b'not an image') == 422
+
+    connection = http.client.HTTPConnection(server_url[len('http://'):], timeout=10)
+    connection.putrequest('POST', '/analyze')
+    connection.putheader('Content-Length', 'abc')
+    connection.endheaders()
+    assert connection.getresponse().status == 400
+    connection.close()
+
+
+def test_timeout_is_503():
+    with running_server(request_timeout=1e-6) as server:
+        url = 'http://127.0.0.1:%d' % server.server_address[1]
+        assert post_status(url, garment_jpeg((40, 160, 40))) == 503
+
+
+def test_batcher_resolves_each_request_when_it_is_done():
+    batcher = MicroBatcher(workers=2, segmentation_method='grabcut', dominant_color_method='histogram')
+    try:
+        slow = batcher.submit(garment_jpeg((200, 30, 30)))
+        fast = batcher.submit(b'not an image')
+        assert fast.result(timeout=30)['error'] is not None
+        assert not slow.done()
+        assert slow.result(timeout=60)['error'] is None
+    finally:
+        batcher.close()
+
+
+def test_batcher_names_a_batch_of_colors():
+    batcher = MicroBatcher(workers=2, max_wait_ms=1000, segmentation_method='threshold',
+                           dominant_color_method='histogram', profile=True)
+    try:
+        colors = [(40, 160, 40), (200, 30, 30), (30, 30, 200)]
+        futures = [batcher.submit(garment_jpeg(color)) for color in colors]
+        records = [future.result(timeout=30) for future in futures]
+    finally:
+        batcher.close()
+    assert len({record['color_name'] for record in records}) == 3
+    assert all('color_naming' in record['stages'] for record in records)